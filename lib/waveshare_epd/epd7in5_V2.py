@@ -40,6 +40,9 @@ GRAY2  = 0xC0
 GRAY3  = 0x80 #gray
 GRAY4  = 0x00 #Blackest
 
+# Byte-wise NOT table for bytes.translate(); inverts a whole frame in C.
+INVERT = bytes(range(0xFF, -1, -1))
+
 logger = logging.getLogger(__name__)
 
 class EPD:
@@ -247,12 +250,9 @@ class EPD:
             # return a blank buffer
             return [0x00] * (int(self.width/8) * self.height)
 
-        buf = bytearray(img.tobytes('raw'))
         # The bytes need to be inverted, because in the PIL world 0=black and 1=white, but
         # in the e-paper world 0=white and 1=black.
-        for i in range(len(buf)):
-            buf[i] ^= 0xFF
-        return buf
+        return bytearray(img.tobytes('raw').translate(INVERT))
     
     def getbuffer_4Gray(self, image):
         # logger.debug("bufsiz = ",int(self.width/8) * self.height)
@@ -296,12 +296,9 @@ class EPD:
         else:
             Width = self.width // 8 +1
         Height = self.height
-        image1 = [0xFF] * int(self.width * self.height / 8)
-        for j in range(Height):
-                for i in range(Width):
-                    image1[i + j * Width] = ~image[i + j * Width]
+        image = bytes(image[:Width * Height])
         self.send_command(0x10)
-        self.send_data2(image1)
+        self.send_data2(image.translate(INVERT))
 
         self.send_command(0x13)
         self.send_data2(image)
@@ -312,9 +309,9 @@ class EPD:
 
     def Clear(self):
         self.send_command(0x10)
-        self.send_data2([0xFF] * int(self.width * self.height / 8))
+        self.send_data2(b'\xff' * int(self.width * self.height / 8))
         self.send_command(0x13)
-        self.send_data2([0x00] * int(self.width * self.height / 8))
+        self.send_data2(b'\x00' * int(self.width * self.height / 8))
 
         self.send_command(0x12)
         epdconfig.delay_ms(100)
@@ -353,10 +350,8 @@ class EPD:
         self.send_data ((Yend-1)%256)  #y-end
         self.send_data (0x01)
 
-        image1 = [0xFF] * int(self.width * self.height / 8)
-        for j in range(Height):
-                for i in range(Width):
-                    image1[i + j * Width] = ~Image[i + j * Width]
+        # Only the window's bytes, inverted in one pass and sent as one bulk write
+        image1 = bytes(Image[:Width * Height]).translate(INVERT)
 
         self.send_command(0x13)   #Write Black and White image to RAM
         self.send_data2(image1)
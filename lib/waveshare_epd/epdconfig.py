@@ -144,7 +144,7 @@ class RaspberryPi:
                 return 0
             # SPI device, bus = 0, device = 0
             self.SPI.open(0, 0)
-            self.SPI.max_speed_hz = 4000000
+            self.SPI.max_speed_hz = 10000000
             self.SPI.mode = 0b00
             self._spi_open = True
         return 0
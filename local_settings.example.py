@@ -14,5 +14,5 @@ LON = 11
 
 # Paste the MVV monitor HTML snippet below. Leave it blank to skip MVV entirely.
 # You can grab the snippet from https://www.mvv-muenchen.de/ by configuring your stop
-# and copying the "embed" HTML.
+# and copying the "embed" HTML. Only the stop id and line filter are read from it.
 MVV_HTML = ""
@@ -4,8 +4,7 @@ set -euo pipefail
 # --------------------------------------
 # Raspberry Pi / Debian (bookworm/trixie) setup for:
 # - Waveshare 7.5" epaper demos
-# - Open-Meteo (requests)
-# - Selenium + Chromium + Chromedriver
+# - Open-Meteo / MVV departures (requests)
 # --------------------------------------
 
 # ---- detect target user for group membership ----
@@ -15,36 +14,13 @@ echo "==> Updating and upgrading apt index…"
 apt-get update -y
 apt-get upgrade -y
 
-# ---- helper to check if a package name exists in repo ----
-has_pkg() {
-  apt-cache show "$1" > /dev/null 2>&1
-}
-
-# ---- pick Chromium package names for this distro ----
-CHROMIUM_PKG=""
-CHROMEDRIVER_PKG=""
-if has_pkg chromium; then
-  CHROMIUM_PKG="chromium"
-elif has_pkg chromium-browser; then
-  CHROMIUM_PKG="chromium-browser"
-fi
-
-if has_pkg chromium-driver; then
-  CHROMEDRIVER_PKG="chromium-driver"
-elif has_pkg chromedriver; then
-  CHROMEDRIVER_PKG="chromedriver"
-fi
-
 echo "==> Installing system packages…"
 # Core Python + libs used in your scripts
 apt-get install -y \
   python3 python3-pip python3-venv \
-  python3-requests python3-pil \
+  python3-requests python3-pil python3-numpy \
   python3-rpi.gpio python3-spidev \
-  fonts-dejavu-core \
-  ${CHROMIUM_PKG:+$CHROMIUM_PKG} \
-  ${CHROMEDRIVER_PKG:+$CHROMEDRIVER_PKG} \
-  python3-selenium
+  fonts-dejavu-core
 
 # ---- enable SPI if not already ----
 CONFIG1="/boot/firmware/config.txt"
@@ -73,7 +49,7 @@ usermod -aG spi,gpio "$TARGET_USER" || true
 echo "==> Verifying Python imports…"
 python3 - <<'PY'
 import sys
-mods = ["RPi.GPIO","spidev","PIL","requests","selenium"]
+mods = ["RPi.GPIO","spidev","PIL","numpy","requests"]
 ok = True
 for m in mods:
     try:
@@ -85,19 +61,6 @@ for m in mods:
 sys.exit(0 if ok else 1)
 PY
 
-# ---- show Chromium/driver paths if present ----
-if command -v chromium >/dev/null 2>&1; then
-  echo "Chromium:" "$(command -v chromium)"
-elif command -v chromium-browser >/dev/null 2>&1; then
-  echo "Chromium:" "$(command -v chromium-browser)"
-fi
-
-if [ -x /usr/bin/chromedriver ]; then
-  echo "Chromedriver: /usr/bin/chromedriver"
-elif command -v chromedriver >/dev/null 2>&1; then
-  echo "Chromedriver:" "$(command -v chromedriver)"
-fi
-
 echo
 echo "✅ Setup complete."
 if [ "${SPI_ENABLED}" = "1" ]; then
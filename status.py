@@ -7,18 +7,28 @@ Private details such as timezone, coordinates, and MVV configuration live in
 and adjust it for your setup before running this script.
 """
 
-import io
+import functools
 import logging
 import os
+import re
 import sys
-import tempfile
 import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from html.parser import HTMLParser
 from pathlib import Path
 
+import numpy as np
 import requests
 from PIL import Image, ImageDraw, ImageFont
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing when installed
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Paths and private settings
@@ -64,15 +74,19 @@ if hasattr(time, "tzset"):
 W, H = 800, 480
 
 SLIDE_INTERVAL = 60
-WX_REFRESH = 15 * 60
-RAIN_REFRESH = 5 * 60
+WX_REFRESH = 5 * 60
 MVV_REFRESH = 120
+MVV_LEAD = 5
 FULL_REFRESH = 60 * 60
+WAKE_SLACK = 0.02
 
 RAIN_THRESHOLD_MM = 0.1
 RAIN_WINDOW_STEPS = 8
 
+# Partial-refresh windows; x coordinates must stay byte aligned (multiples of 8).
 PROG_BOX = (0, H - 10, W, H)
+CLOCK_BOX = (0, 40, W, 160)
+WX_BODY_BOX = (0, 184, W, H)
 PROG_SEG_W = 10
 PROG_GAP = 6
 PROG_BASE_THICK = 1
@@ -126,38 +140,82 @@ WMO_DE = {
 }
 
 
+# ---------------------------------------------------------------------------
+# HTTP session
+# ---------------------------------------------------------------------------
+# One keep-alive session for all API calls so every refresh reuses the open
+# TLS connection instead of paying a fresh handshake on the Pi. Keep one
+# connection pool per host (Open-Meteo and MVV) so neither evicts the other.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    ),
+)
+SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
+
+def parse_json(resp):
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=512)
+def text_bbox(text: str, font: ImageFont.FreeTypeFont):
+    # Same box as ImageDraw.textbbox((0, 0), ...) on a mode "1" canvas.
+    return font.getbbox(text, mode="1")
+
+
+# Warm the cache so the first weather frame needs no glyph measurements.
+for _cond in WMO_DE.values():
+    text_bbox(_cond, FONT_BIG)
+del _cond
+
+
+_DE_WEEKDAYS = {
+    "Mon": "Mo",
+    "Tue": "Di",
+    "Wed": "Mi",
+    "Thu": "Do",
+    "Fri": "Fr",
+    "Sat": "Sa",
+    "Sun": "So",
+}
+_DE_MONTHS = {
+    "Mar": "Mär",
+    "May": "Mai",
+    "Oct": "Okt",
+    "Dec": "Dez",
+}
+_DE_NAMES = {**_DE_WEEKDAYS, **_DE_MONTHS}
+_DE_NAMES_RE = re.compile(r"\b(" + "|".join(_DE_NAMES) + r")\b")
+
+
+# Formatted date of the last (year, yday) seen; it only changes at midnight.
+_DE_DATE = {"key": None, "text": ""}
+
+
 def de_date_local() -> str:
-    s = time.strftime("%a %d %b %Y", time.localtime())
-    repl = {
-        "Mon": "Mo",
-        "Tue": "Di",
-        "Wed": "Mi",
-        "Thu": "Do",
-        "Fri": "Fr",
-        "Sat": "Sa",
-        "Sun": "So",
-        "Jan": "Jan",
-        "Feb": "Feb",
-        "Mar": "Mär",
-        "Apr": "Apr",
-        "May": "Mai",
-        "Jun": "Jun",
-        "Jul": "Jul",
-        "Aug": "Aug",
-        "Sep": "Sep",
-        "Oct": "Okt",
-        "Nov": "Nov",
-        "Dec": "Dez",
-    }
-    for k, v in repl.items():
-        s = s.replace(k, v)
-    return s
+    lt = time.localtime()
+    key = (lt.tm_year, lt.tm_yday)
+    if _DE_DATE["key"] != key:
+        s = time.strftime("%a %d %b %Y", lt)
+        _DE_DATE.update(key=key, text=_DE_NAMES_RE.sub(lambda m: _DE_NAMES[m.group(1)], s))
+    return _DE_DATE["text"]
+
+
+# Validators and payload of the last Open-Meteo response; a 304 reuses it.
+_WX_CACHE = {}
 
 
-def fetch_current_weather():
+def fetch_weather_bundle(threshold: float = RAIN_THRESHOLD_MM):
     url = "https://api.open-meteo.com/v1/dwd-icon"
     params = {
         "latitude": LAT,
@@ -170,32 +228,44 @@ def fetch_current_weather():
             "weather_code",
             "wind_speed_10m",
         ],
+        "minutely_15": ["precipitation"],
+        "forecast_minutely_15": RAIN_WINDOW_STEPS,
     }
-    resp = requests.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    current = resp.json().get("current") or {}
+    headers = {}
+    if _WX_CACHE.get("etag"):
+        headers["If-None-Match"] = _WX_CACHE["etag"]
+    if _WX_CACHE.get("last_modified"):
+        headers["If-Modified-Since"] = _WX_CACHE["last_modified"]
+
+    resp = SESSION.get(url, params=params, headers=headers, timeout=10)
+    if resp.status_code == 304 and "payload" in _WX_CACHE:
+        payload = _WX_CACHE["payload"]
+    else:
+        resp.raise_for_status()
+        payload = parse_json(resp)
+        _WX_CACHE.update(
+            payload=payload,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+    return _current_weather(payload), _rain_eta(payload, threshold)
+
+
+def _current_weather(payload):
+    current = payload.get("current") or {}
+    code = current.get("weather_code")
     return {
         "time": current.get("time"),
         "temp": current.get("temperature_2m"),
         "feels": current.get("apparent_temperature"),
         "precip": current.get("precipitation"),
-        "code": current.get("weather_code"),
+        "code": int(code) if code is not None else None,
         "wind": current.get("wind_speed_10m"),
     }
 
 
-def fetch_rain_eta(threshold: float = RAIN_THRESHOLD_MM):
-    url = "https://api.open-meteo.com/v1/dwd-icon"
-    params = {
-        "latitude": LAT,
-        "longitude": LON,
-        "timezone": TZ,
-        "minutely_15": ["precipitation"],
-        "forecast_minutely_15": RAIN_WINDOW_STEPS,
-    }
-    resp = requests.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json().get("minutely_15") or {}
+def _rain_eta(payload, threshold: float):
+    data = payload.get("minutely_15") or {}
     times = data.get("time") or []
     prec = data.get("precipitation") or []
 
@@ -213,76 +283,109 @@ def fetch_rain_eta(threshold: float = RAIN_THRESHOLD_MM):
 # ---------------------------------------------------------------------------
 # MVV widget helpers
 # ---------------------------------------------------------------------------
-def init_browser():
-    if not MVV_HTML:
-        raise RuntimeError("MVV HTML snippet not configured.")
-
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    from selenium.common.exceptions import TimeoutException
-
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".html")
-    tmp.write(MVV_HTML.encode("utf-8"))
-    tmp.flush()
-    tmp.close()
-
-    opts = Options()
-    opts.add_argument("--headless=new")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--remote-allow-origins=*")
-    opts.add_argument("--window-size=800,480")
-    try:
-        opts.page_load_strategy = "none"
-    except Exception:
-        pass
-
-    svc_path = "/usr/bin/chromedriver"
-    service = Service(svc_path) if os.path.exists(svc_path) else Service()
-    driver = webdriver.Chrome(service=service, options=opts)
-    driver.set_page_load_timeout(120)
-    try:
-        driver.get("file://" + tmp.name)
-    except TimeoutException:
-        pass
+MVV_URL = "https://www.mvv-muenchen.de/"
+MVV_ROWS = 8
+MVV_BOX = (30, 30, W - 30, H - 30)
+_MVV_STOP_RE = re.compile(r"de:\d+:\d+")
 
-    return driver, tmp.name
 
+class _MvvSnippetParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.attrs = None
 
-def grab_mvv_png(driver):
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    def handle_starttag(self, tag, attrs):
+        if self.attrs is None and "mvv-departure-monitor" in (dict(attrs).get("class") or ""):
+            self.attrs = {k: v or "" for k, v in attrs}
 
-    element = WebDriverWait(driver, 30).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, ".mvv-departure-monitor"))
-    )
-    return element.screenshot_as_png
 
+def _parse_mvv_snippet(html: str):
+    parser = _MvvSnippetParser()
+    parser.feed(html)
+    attrs = parser.attrs or {}
 
-def reset_mvv_driver(state):
-    driver = state.pop("driver", None)
-    if driver:
-        try:
-            driver.quit()
-        except Exception:
-            pass
-    html_path = state.pop("html_path", None)
-    if html_path and os.path.exists(html_path):
-        try:
-            os.unlink(html_path)
-        except OSError:
-            pass
-    for key in ("png_bytes", "png_path", "last_reload", "last_shot"):
-        state.pop(key, None)
+    stop_id = next((v for v in attrs.values() if _MVV_STOP_RE.fullmatch(v)), None)
+    if stop_id is None:
+        match = _MVV_STOP_RE.search(html)
+        stop_id = match.group(0) if match else None
+    if stop_id is None:
+        raise SystemExit("MVV_HTML does not contain a stop id (e.g. `de:09162:6`).")
+
+    lines = next((v for k, v in attrs.items() if "line" in k and v), None)
+    return {"stop_id": stop_id, "lines": lines}
+
+
+MVV_STOP = _parse_mvv_snippet(MVV_HTML) if MVV_HTML else None
+
+
+def fetch_mvv_departures():
+    params = {
+        "eID": "departuresFinder",
+        "action": "get_departures",
+        "stop_id": MVV_STOP["stop_id"],
+        "requested_timestamp": int(time.time()),
+    }
+    if MVV_STOP["lines"]:
+        params["lines"] = MVV_STOP["lines"]
+    resp = SESSION.get(MVV_URL, params=params, timeout=8)
+    resp.raise_for_status()
+
+    rows = []
+    for dep in (parse_json(resp).get("departures") or [])[:MVV_ROWS]:
+        line = dep.get("line") or {}
+        rows.append(
+            {
+                "line": str(line.get("number") or line.get("name") or ""),
+                "direction": str(dep.get("direction") or line.get("direction") or ""),
+                "time": str(dep.get("departureLive") or dep.get("departurePlanned") or ""),
+            }
+        )
+    return rows
+
+
+def _fit_text(text: str, font, max_w: int) -> str:
+    if font.getlength(text) <= max_w:
+        return text
+    while text and font.getlength(text + "…") > max_w:
+        text = text[:-1]
+    return text + "…"
+
+
+def _mvv_background():
+    img = Image.new("1", (W, H), 255)
+    d = ImageDraw.Draw(img)
+    d.rectangle(MVV_BOX, outline=0, width=2)
+    d.text((MVV_BOX[0] + 20, MVV_BOX[1] + 14), "Abfahrten", font=FONT_BIG, fill=0)
+    return img
+
+
+# Static frame and title of the departures slide, pasted as the first layer.
+_MVV_BG = _mvv_background()
+
+
+def draw_departures(img, departures):
+    img.paste(_MVV_BG, (0, 0))
+    d = ImageDraw.Draw(img)
+    x1, y1, x2, y2 = MVV_BOX
+    y = y1 + 74
+    row_h = (y2 - 10 - y) // MVV_ROWS
+    for dep in departures:
+        tw = d.textlength(dep["time"], font=FONT_SM)
+        d.text((x1 + 20, y), dep["line"], font=FONT_SM, fill=0)
+        direction = _fit_text(dep["direction"], FONT_SM, int(x2 - 40 - tw - (x1 + 110)))
+        d.text((x1 + 110, y), direction, font=FONT_SM, fill=0)
+        d.text((x2 - 20 - tw, y), dep["time"], font=FONT_SM, fill=0)
+        y += row_h
 
 
 def get_mvv_image_cached(state):
+    if "image" in state:
+        return state["image"], state.get("err")
+
+    canvas = Image.new("1", (W, H), 255)
+    state["image"] = canvas
+    d = ImageDraw.Draw(canvas)
     if not MVV_HTML:
-        canvas = Image.new("1", (W, H), 255)
-        d = ImageDraw.Draw(canvas)
         d.text(
             (40, H // 2 - 20),
             "MVV Monitor nicht konfiguriert",
@@ -292,63 +395,11 @@ def get_mvv_image_cached(state):
         state["err"] = "MVV Monitor nicht konfiguriert"
         return canvas, state["err"]
 
-    now = time.monotonic()
-    if "driver" not in state:
-        try:
-            state["driver"], state["html_path"] = init_browser()
-        except Exception as exc:
-            logging.warning("MVV screenshot update failed: %s", exc)
-            state["err"] = f"MVV: {exc}".splitlines()[0]
-            reset_mvv_driver(state)
-            return Image.new("1", (W, H), 255), state["err"]
-        state["last_reload"] = 0.0
-
-    legacy_png = state.pop("png_path", None)
-    if legacy_png and os.path.exists(legacy_png):
-        try:
-            os.unlink(legacy_png)
-        except OSError:
-            pass
+    departures = state.get("departures")
+    if departures:
+        draw_departures(canvas, departures)
+        return canvas, state.get("err")
 
-    if (now - state.get("last_shot", 0)) > MVV_REFRESH:
-        try:
-            if (now - state.get("last_reload", 0)) > 600:
-                from selenium.common.exceptions import TimeoutException
-
-                try:
-                    state["driver"].get("file://" + state["html_path"])
-                except TimeoutException:
-                    pass
-                state["last_reload"] = now
-
-            state["png_bytes"] = grab_mvv_png(state["driver"])
-            state["last_shot"] = now
-            state["err"] = None
-        except Exception as exc:
-            logging.warning("MVV screenshot update failed: %s", exc)
-            state["err"] = f"MVV: {exc}".splitlines()[0]
-            reset_mvv_driver(state)
-
-    canvas = Image.new("1", (W, H), 255)
-    png_bytes = state.get("png_bytes")
-    if png_bytes:
-        try:
-            with Image.open(io.BytesIO(png_bytes)) as src_raw:
-                src = src_raw.convert("L")
-        except OSError as exc:
-            logging.warning("Failed to decode MVV screenshot: %s", exc)
-            state["err"] = f"MVV: {exc}".splitlines()[0]
-            state.pop("png_bytes", None)
-        else:
-            src.thumbnail((W - 80, H - 120))
-            x = (W - src.width) // 2
-            y = (H - src.height) // 2
-            canvas.paste(src.convert("1"), (x, y))
-            d = ImageDraw.Draw(canvas)
-            d.rectangle((x - 10, y - 10, x + src.width + 10, y + src.height + 10), outline=0, width=2)
-            return canvas, state.get("err")
-
-    d = ImageDraw.Draw(canvas)
     d.text((40, H // 2 - 20), state.get("err") or "MVV Monitor nicht verfügbar", font=FONT_SM, fill=0)
     return canvas, state.get("err")
 
@@ -356,43 +407,105 @@ def get_mvv_image_cached(state):
 # ---------------------------------------------------------------------------
 # Drawing helpers
 # ---------------------------------------------------------------------------
-def draw_progress(img, frac: float):
-    frac = max(0.0, min(1.0, frac))
-    d = ImageDraw.Draw(img)
-    d.rectangle(PROG_BOX, fill=255)
+_PROG_STEP = PROG_SEG_W + PROG_GAP
+_PROG_SEGS = max(1, (PROG_BOX[2] - PROG_BOX[0]) // _PROG_STEP)
 
-    x1, y1, x2, y2 = PROG_BOX
-    cy = (y1 + y2) // 2
-    step = PROG_SEG_W + PROG_GAP
-    segs = max(1, (x2 - x1) // step)
-    filled = int(round(frac * segs))
 
-    for i in range(segs):
-        sx = x1 + i * step
+def _progress_base():
+    x1, y1, x2, y2 = PROG_BOX
+    img = Image.new("1", (x2 - x1, y2 - y1), 255)
+    d = ImageDraw.Draw(img)
+    cy = (y2 - y1) // 2
+    for i in range(_PROG_SEGS):
+        sx = i * _PROG_STEP
         d.rectangle((sx, cy - PROG_BASE_THICK // 2, sx + PROG_SEG_W, cy + PROG_BASE_THICK // 2), fill=0)
+    return img
+
+
+# Cleared bar strip with every thin base segment already drawn.
+_PROG_BASE = _progress_base()
+
+
+def progress_filled(frac: float) -> int:
+    frac = max(0.0, min(1.0, frac))
+    return int(round(frac * _PROG_SEGS))
+
+
+def next_progress_change(started_at: float, interval: float, filled: int) -> float:
+    # progress_filled() rounds, so segment k+1 lights at fraction (k + 0.5) / segs.
+    return started_at + (filled + 0.5) * interval / _PROG_SEGS
+
+
+def draw_progress(img, frac: float) -> int:
+    x1, y1, x2, y2 = PROG_BOX
+    img.paste(_PROG_BASE, (x1, y1))
 
+    d = ImageDraw.Draw(img)
+    cy = (y1 + y2) // 2
+    filled = progress_filled(frac)
     for i in range(filled):
-        sx = x1 + i * step
+        sx = x1 + i * _PROG_STEP
         d.rectangle((sx, cy - PROG_FILL_THICK // 2, sx + PROG_SEG_W, cy + PROG_FILL_THICK // 2), fill=0)
+    return filled
 
 
 def erase_top_line(img):
     ImageDraw.Draw(img).rectangle((0, 0, W, TOP_ERASE_H), fill=255)
 
 
-def draw_slide_weather(img, weather, rain_eta, err=None):
+def _weather_background():
+    img = Image.new("1", (W, H), 255)
+    ImageDraw.Draw(img).line((40, 180, W - 40, 180), fill=0, width=2)
+    return img
+
+
+# Cleared canvas plus separator line; every weather render starts from a copy.
+_WEATHER_BG = _weather_background()
+
+
+def clock_text() -> str:
+    return time.strftime("%H:%M", time.localtime())
+
+
+def _clock_glyphs():
+    glyphs = {}
+    for c in "0123456789:":
+        left, top, right, bottom = FONT_TIME.getbbox(c, mode="1")
+        mask = Image.new("1", (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), c, font=FONT_TIME, fill=255)
+        glyphs[c] = (left, top, mask, FONT_TIME.getlength(c, mode="1"))
+    return glyphs
+
+
+# Pre-rasterized FONT_TIME digits; pasting them matches d.text() pixel for pixel.
+CLOCK_GLYPHS = _clock_glyphs()
+
+
+def paint_clock(img, hhmm: str, x: int, y: int):
+    cursor = float(x)
+    for c in hhmm:
+        left, top, mask, advance = CLOCK_GLYPHS[c]
+        img.paste(0, (round(cursor) + left, y + top), mask)
+        cursor += advance
+
+
+def draw_clock(img):
     d = ImageDraw.Draw(img)
-    d.rectangle((0, 0, W, H), fill=255)
+    d.rectangle(CLOCK_BOX, fill=255)
 
-    now = time.strftime("%H:%M", time.localtime())
-    tw, th = d.textbbox((0, 0), now, font=FONT_TIME)[2:]
-    d.text(((W - tw) // 2, 40 + (120 - th) // 2), now, font=FONT_TIME, fill=0)
+    now = clock_text()
+    tw, th = text_bbox(now, FONT_TIME)[2:]
+    paint_clock(img, now, (W - tw) // 2, 40 + (120 - th) // 2)
 
     ds = de_date_local()
-    dw, dh = d.textbbox((0, 0), ds, font=FONT_DATE)[2:]
+    dw, dh = text_bbox(ds, FONT_DATE)[2:]
     d.text((W - 40 - dw, 160 - dh), ds, font=FONT_DATE, fill=0)
 
-    d.line((40, 180, W - 40, 180), fill=0, width=2)
+
+def draw_slide_weather(img, weather, rain_eta, err=None):
+    img.paste(_WEATHER_BG, (0, 0))
+    draw_clock(img)
+    d = ImageDraw.Draw(img)
 
     y = 200
     if err:
@@ -405,13 +518,13 @@ def draw_slide_weather(img, weather, rain_eta, err=None):
         else:
             headline = f"Regen in {rain_eta} min"
     d.text((40, y), headline, font=FONT_BIG, fill=0)
-    y += d.textbbox((0, 0), headline, font=FONT_BIG)[3] + 10
+    y += text_bbox(headline, FONT_BIG)[3] + 10
 
     if weather:
         code = weather.get("code")
-        cond = WMO_DE.get(int(code) if code is not None else 3, f"Code {code}")
+        cond = WMO_DE[3] if code is None else WMO_DE.get(code) or f"Code {code}"
         d.text((40, y), cond, font=FONT_BIG, fill=0)
-        y += d.textbbox((0, 0), cond, font=FONT_BIG)[3] + 6
+        y += text_bbox(cond, FONT_BIG)[3] + 6
 
         temp = weather.get("temp")
         feels = weather.get("feels")
@@ -420,7 +533,7 @@ def draw_slide_weather(img, weather, rain_eta, err=None):
             if feels is not None:
                 text += f" (gefühlt {round(feels)}°C)"
             d.text((40, y), text, font=FONT_BIG, fill=0)
-            y += d.textbbox((0, 0), text, font=FONT_BIG)[3] + 6
+            y += text_bbox(text, FONT_BIG)[3] + 6
 
         extras = []
         if weather.get("wind") is not None:
@@ -435,37 +548,52 @@ def draw_slide_mvv(img, mvv_img):
     img.paste(mvv_img, (0, 0))
 
 
-def push_frame(epd, frame, *, full_refresh: bool):
-    buffer = epd.getbuffer(frame)
+def _fast_getbuffer(img) -> bytes:
+    # Same layout as epd.getbuffer (1 = black), packed in C instead of a
+    # per-byte Python loop.
+    arr = np.asarray(img, dtype=bool)
+    return np.packbits(~arr, axis=1).tobytes()
+
+
+def push_frame(epd, frame, *, full_refresh: bool, bbox=None):
     if full_refresh:
         epd.init()
-        epd.display(buffer)
+        epd.display(_fast_getbuffer(frame))
         epd.init_part()
+    elif bbox is not None:
+        epd.display_Partial(_fast_getbuffer(frame.crop(bbox)), *bbox)
     else:
-        epd.display_Partial(buffer, 0, 0, W, H)
+        epd.display_Partial(_fast_getbuffer(frame), 0, 0, W, H)
 
 
-def update_progress(epd, frame, started_at, interval):
+def update_progress(epd, frame, started_at, interval, state):
     fraction = (time.monotonic() - started_at) / interval
-    draw_progress(frame, fraction)
-    erase_top_line(frame)
-    push_frame(epd, frame, full_refresh=False)
+    if progress_filled(fraction) == state.get("last_filled"):
+        return
+    state["last_filled"] = draw_progress(frame, fraction)
+    push_frame(epd, frame, full_refresh=False, bbox=PROG_BOX)
+
 
+def update_clock(epd, frame):
+    draw_clock(frame)
+    push_frame(epd, frame, full_refresh=False, bbox=CLOCK_BOX)
 
-def render_weather(epd, frame, weather, rain_eta, error, progress, *, full):
+
+def render_weather(epd, frame, weather, rain_eta, error, progress, *, full, bbox=None):
     draw_slide_weather(frame, weather, rain_eta, error)
     erase_top_line(frame)
-    draw_progress(frame, progress)
-    push_frame(epd, frame, full_refresh=full)
+    filled = draw_progress(frame, progress)
+    push_frame(epd, frame, full_refresh=full, bbox=bbox)
+    return filled
 
 
 def render_mvv(epd, frame, mvv_state, progress, *, full):
-    mvv_img, mvv_err = get_mvv_image_cached(mvv_state)
+    mvv_img, _ = get_mvv_image_cached(mvv_state)
     draw_slide_mvv(frame, mvv_img)
     erase_top_line(frame)
-    draw_progress(frame, progress)
+    filled = draw_progress(frame, progress)
     push_frame(epd, frame, full_refresh=full)
-    return mvv_err
+    return filled
 
 
 def safe_fetch(fetcher, label):
@@ -484,69 +612,121 @@ def main():
     epd = epd7in5_V2.EPD()
     frame = Image.new("1", (W, H), 255)
 
+    # No init_part() here: the first render below is a full refresh that
+    # runs its own init() and leaves the panel in partial mode.
     try:
         epd.init()
         epd.Clear()
-        epd.init_part()
     except Exception as exc:
         raise SystemExit(f"Failed to initialise display: {exc}") from exc
 
-    weather_data, weather_err = safe_fetch(fetch_current_weather, "weather")
-    rain_eta, rain_err = safe_fetch(fetch_rain_eta, "rain")
-    weather_error = weather_err or rain_err
+    bundle, weather_error = safe_fetch(fetch_weather_bundle, "weather")
+    weather_data, rain_eta = bundle or (None, None)
 
-    render_weather(epd, frame, weather_data, rain_eta, weather_error, 0.0, full=True)
+    progress_state = {}
+    last_clock = clock_text()
+    progress_state["last_filled"] = render_weather(epd, frame, weather_data, rain_eta, weather_error, 0.0, full=True)
 
     mvv_state = {}
     slide = "weather"
     now = time.monotonic()
     slide_started = now
     last_weather = now
-    last_rain = now
-    last_mvv = now
+    last_mvv = now - MVV_REFRESH
     last_full = now
 
+    # Network calls run on worker threads so a slow API never stalls the
+    # progress bar; only this loop talks to the display.
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch")
+    weather_job = None
+    mvv_job = None
+
     try:
         while True:
             now = time.monotonic()
 
-            update_progress(epd, frame, slide_started, SLIDE_INTERVAL)
+            update_progress(epd, frame, slide_started, SLIDE_INTERVAL, progress_state)
 
             if now - slide_started >= SLIDE_INTERVAL:
                 slide = "mvv" if slide == "weather" else "weather"
                 slide_started = now
                 if slide == "weather":
-                    render_weather(epd, frame, weather_data, rain_eta, weather_error, 0.0, full=True)
+                    last_clock = clock_text()
+                    progress_state["last_filled"] = render_weather(
+                        epd, frame, weather_data, rain_eta, weather_error, 0.0, full=True
+                    )
                 else:
-                    render_mvv(epd, frame, mvv_state, 0.0, full=False)
+                    progress_state["last_filled"] = render_mvv(epd, frame, mvv_state, 0.0, full=False)
 
-            if slide == "weather" and now - last_weather >= WX_REFRESH:
-                weather_data, weather_err = safe_fetch(fetch_current_weather, "weather")
-                weather_error = weather_err or rain_err
-                progress = (now - slide_started) / SLIDE_INTERVAL
-                render_weather(epd, frame, weather_data, rain_eta, weather_error, progress, full=False)
-                last_weather = now
+            if slide == "weather" and clock_text() != last_clock:
+                last_clock = clock_text()
+                update_clock(epd, frame)
 
-            if slide == "weather" and now - last_rain >= RAIN_REFRESH:
-                rain_eta, rain_err = safe_fetch(fetch_rain_eta, "rain")
-                weather_error = weather_err or rain_err
-                progress = (now - slide_started) / SLIDE_INTERVAL
-                render_weather(epd, frame, weather_data, rain_eta, weather_error, progress, full=False)
-                last_rain = now
+            if weather_job is None and now - last_weather >= WX_REFRESH:
+                weather_job = pool.submit(safe_fetch, fetch_weather_bundle, "weather")
+                last_weather = now
 
-            if slide == "mvv" and now - last_mvv >= MVV_REFRESH:
-                progress = (now - slide_started) / SLIDE_INTERVAL
-                render_mvv(epd, frame, mvv_state, progress, full=False)
+            if weather_job is not None and weather_job.done():
+                bundle, error = weather_job.result()
+                weather_job = None
+                fresh = bundle or (None, None)
+                if (fresh, error) != ((weather_data, rain_eta), weather_error):
+                    (weather_data, rain_eta), weather_error = fresh, error
+                    if slide == "weather":
+                        progress = (now - slide_started) / SLIDE_INTERVAL
+                        progress_state["last_filled"] = render_weather(
+                            epd, frame, weather_data, rain_eta, weather_error, progress, full=False, bbox=WX_BODY_BOX
+                        )
+
+            mvv_next = slide == "mvv" or now - slide_started >= SLIDE_INTERVAL - MVV_LEAD
+            if MVV_HTML and mvv_job is None and mvv_next and now - last_mvv >= MVV_REFRESH:
+                mvv_job = pool.submit(safe_fetch, fetch_mvv_departures, "MVV")
                 last_mvv = now
 
+            if mvv_job is not None and mvv_job.done():
+                departures, error = mvv_job.result()
+                error = f"MVV: {error}" if error else None
+                mvv_job = None
+                if (departures, error) != (mvv_state.get("departures"), mvv_state.get("err")):
+                    mvv_state.update(departures=departures, err=error)
+                    mvv_state.pop("image", None)
+                    if slide == "mvv":
+                        progress = (now - slide_started) / SLIDE_INTERVAL
+                        progress_state["last_filled"] = render_mvv(epd, frame, mvv_state, progress, full=False)
+
             if now - last_full >= FULL_REFRESH:
                 if slide == "weather":
-                    render_weather(epd, frame, weather_data, rain_eta, weather_error, (now - slide_started) / SLIDE_INTERVAL, full=True)
+                    last_clock = clock_text()
+                    progress_state["last_filled"] = render_weather(
+                        epd, frame, weather_data, rain_eta, weather_error, (now - slide_started) / SLIDE_INTERVAL, full=True
+                    )
                 else:
-                    render_mvv(epd, frame, mvv_state, (now - slide_started) / SLIDE_INTERVAL, full=True)
+                    progress_state["last_filled"] = render_mvv(
+                        epd, frame, mvv_state, (now - slide_started) / SLIDE_INTERVAL, full=True
+                    )
                 last_full = now
 
-            time.sleep(1)
+            # Sleep until the next thing that can change the panel instead
+            # of waking every second; a finishing fetch also wakes us.
+            deadlines = [
+                next_progress_change(slide_started, SLIDE_INTERVAL, progress_state["last_filled"]),
+                slide_started + SLIDE_INTERVAL,
+                last_full + FULL_REFRESH,
+            ]
+            if slide == "weather":
+                deadlines.append(time.monotonic() + 60 - time.time() % 60)
+            if weather_job is None:
+                deadlines.append(last_weather + WX_REFRESH)
+            if MVV_HTML and mvv_job is None:
+                mvv_window = now if slide == "mvv" else slide_started + SLIDE_INTERVAL - MVV_LEAD
+                deadlines.append(max(last_mvv + MVV_REFRESH, mvv_window))
+
+            delay = max(0.0, min(deadlines) - time.monotonic()) + WAKE_SLACK
+            jobs = [job for job in (weather_job, mvv_job) if job is not None]
+            if jobs:
+                wait(jobs, timeout=delay, return_when=FIRST_COMPLETED)
+            else:
+                time.sleep(delay)
 
     except KeyboardInterrupt:
         logging.info("Stopping slideshow...")
@@ -554,7 +734,7 @@ def main():
         logging.error("Unhandled error: %s", exc)
         traceback.print_exc()
     finally:
-        reset_mvv_driver(mvv_state)
+        pool.shutdown(wait=False, cancel_futures=True)
         try:
             epd.sleep()
         except Exception: